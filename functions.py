@@ -9,6 +9,8 @@ Features:
 - Converts Wikipedia LaTeX fragments to MathJax-compatible syntax
 - Collapses stacked/vertical math tokens into inline expressions
 - Graceful fallback to plain text in terminal environments
+- Caches fetched pages in memory and on disk (~/.cache/wiki_math/, 30 days)
+- Concurrent fetching of several queries with wiki_math_batch
 - Uses only standard library + wikipedia + IPython (no fragile dependencies)
 
 Usage:
@@ -17,42 +19,311 @@ Usage:
     # In Jupyter Notebook:
     wiki_math("Singular value decomposition")
     
+    # Several pages at once (fetched concurrently):
+    wiki_math_batch(["Singular value decomposition", "Eigendecomposition of a matrix"])
+    
     # Or get the formatted content as a string:
     content = wiki_fetch("Singular value decomposition")
     print(content)
 """
 
+import functools
+import os
+import random
 import re
-import wikipedia
+import shelve
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+
+# =============================================================================
+# Wikipedia Client
+# =============================================================================
+
+# Keep-alive connections kept open to the Wikipedia API
+_POOL_MAXSIZE = 50
+
+# Minimum spacing between API requests, across all threads. Done here rather
+# than with wikipedia.set_rate_limiting, which truncates the wait to whole
+# seconds and tracks the last call in an unlocked global.
+_RATE_LIMIT_MIN_WAIT = 0.05  # seconds
+_RATE_LIMIT_LOCK = threading.Lock()
+_LAST_REQUEST_AT = float('-inf')
+
+# Retries for Wikipedia API timeouts: up to _RETRY_ATTEMPTS tries, sleeping a
+# random 0..(_RETRY_BASE_DELAY * 2**attempt) seconds between them
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 0.5  # seconds
+
+# Set up by _wikipedia() on first use
+_WIKIPEDIA = None
+_WIKIPEDIA_LOCK = threading.Lock()
+
+
+def _rate_limited(get):
+    """
+    Wrap a requests `get` so calls start at least _RATE_LIMIT_MIN_WAIT apart.
+    
+    The spacing is shared by every thread (e.g. wiki_math_batch workers).
+    
+    Args:
+        get: The function to wrap, e.g. a Session's bound get method.
+        
+    Returns:
+        function: Drop-in replacement for `get`.
+    """
+    def rate_limited_get(*args, **kwargs):
+        global _LAST_REQUEST_AT
+        with _RATE_LIMIT_LOCK:
+            delay = _LAST_REQUEST_AT + _RATE_LIMIT_MIN_WAIT - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            _LAST_REQUEST_AT = time.monotonic()
+        return get(*args, **kwargs)
+    
+    return rate_limited_get
+
+
+def _wikipedia():
+    """
+    Import and configure the wikipedia package on first use.
+    
+    Importing wikipedia pulls in requests and BeautifulSoup, which takes
+    hundreds of milliseconds; deferring it keeps `from functions import ...`
+    cheap for code that never fetches anything.
+    
+    Returns:
+        module: The wikipedia module, wired to the shared pooled session.
+    """
+    global _WIKIPEDIA
+    if _WIKIPEDIA is None:
+        with _WIKIPEDIA_LOCK:
+            if _WIKIPEDIA is None:
+                import requests
+                import wikipedia
+                from requests.adapters import HTTPAdapter
+                
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=10, pool_maxsize=_POOL_MAXSIZE)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                # Space out requests (see _RATE_LIMIT_MIN_WAIT)
+                session.get = _rate_limited(session.get)
+                
+                # The wikipedia package calls requests.get() directly for every API
+                # request. Pointing its module-level `requests` name at the shared
+                # session makes every search/page/summary call reuse a pooled
+                # connection instead of paying a new TCP + TLS handshake each time.
+                wikipedia.wikipedia.requests = session
+                
+                _WIKIPEDIA = wikipedia
+    return _WIKIPEDIA
+
+
+def _with_retry(func, *args, **kwargs):
+    """
+    Call a wikipedia API function, retrying on HTTP timeouts.
+    
+    Uses exponential backoff with full jitter, so concurrent callers don't
+    retry in lockstep. The last timeout is re-raised. Other errors, including
+    HTTP 429 replies (which surface as JSON decode errors), are not retried.
+    
+    Args:
+        func: wikipedia function to call (e.g. wikipedia.page).
+        *args, **kwargs: Passed through to func.
+        
+    Returns:
+        Whatever func returns.
+    """
+    wikipedia = _wikipedia()
+    for attempt in range(_RETRY_ATTEMPTS):
+        try:
+            return func(*args, **kwargs)
+        except wikipedia.HTTPTimeoutError:
+            if attempt == _RETRY_ATTEMPTS - 1:
+                raise
+            time.sleep(random.uniform(0, _RETRY_BASE_DELAY * 2 ** attempt))
 
 
 # =============================================================================
 # Environment Detection
 # =============================================================================
 
-def is_jupyter() -> bool:
+# Cached result of _detect_jupyter(); the environment can't change mid-process
+_IS_JUPYTER = None
+
+
+def _detect_jupyter() -> bool:
     """
     Detect if code is running in a Jupyter Notebook environment.
     
+    Every Jupyter kernel has IPython loaded already, so if it isn't in
+    sys.modules this is a plain script and IPython is never imported.
+    
     Returns:
         bool: True if running in Jupyter, False otherwise (terminal/script).
     """
-    try:
-        from IPython import get_ipython
-        shell = get_ipython()
-        if shell is None:
-            return False
-        # Check for Jupyter-specific shell types
-        shell_name = shell.__class__.__name__
-        return shell_name in ('ZMQInteractiveShell', 'Shell')
-    except (ImportError, NameError):
+    ipython = sys.modules.get('IPython')
+    if ipython is None:
+        return False
+    shell = ipython.get_ipython()
+    if shell is None:
         return False
+    # Check for Jupyter-specific shell types
+    shell_name = shell.__class__.__name__
+    return shell_name in ('ZMQInteractiveShell', 'Shell')
+
+
+def is_jupyter() -> bool:
+    """
+    Detect if code is running in a Jupyter Notebook environment.
+    
+    The check runs once per process; later calls return the cached result.
+    
+    Returns:
+        bool: True if running in Jupyter, False otherwise (terminal/script).
+    """
+    global _IS_JUPYTER
+    if _IS_JUPYTER is None:
+        _IS_JUPYTER = _detect_jupyter()
+    return _IS_JUPYTER
 
 
 # =============================================================================
 # Text Cleaning & Math Conversion
 # =============================================================================
 
+# Patterns are compiled once at import so the cleaning pipeline below calls
+# bound methods directly instead of going through re's pattern cache per call.
+
+# Stacked math token: a line of 1-3 math-like characters
+_MATH_TOKEN_CHARS = r'a-zA-Z0-9×÷±∓≤≥≠≈∈∉⊂⊃∪∩∧∨¬→←↔∀∃∂∇∫∑∏√∞αβγδεζηθικλμνξπρστυφχψωΓΔΘΛΞΠΣΦΨΩ=+\-*/^().,'
+_MATH_TOKEN_RE = re.compile(rf'^[{_MATH_TOKEN_CHARS}]{{1,3}}$')
+
+# {\\displaystyle ...} block with one level of nested braces. `re` has no
+# atomic groups before Python 3.11, so each run is emulated as atomic with
+# (?=(X))\N: once matched it is never re-tried character by character, which
+# keeps unbalanced input from triggering backtracking.
+_DISPLAYSTYLE_RE = re.compile(
+    r'\{\\displaystyle(?=(\s+))\1'
+    r'(?P<body>(?=([^{}]*))\3(?:\{[^{}]*\}(?=([^{}]*))\4)*)'
+    r'\}'
+)
+
+# LaTeX commands not already wrapped in $...$: \mathbf/\mathit/\mathrm{...}
+# take their whole argument, anything else is \cmd with an optional {arg}.
+# (?![A-Za-z]) keeps backtracking from cutting a command name short when the
+# (?!\$) check fails (e.g. "\Sigma$" must not become "\Sigm" + "a")
+_INLINE_LATEX_RE = re.compile(
+    r'(?<!\$)(\\(?:mathbf|mathit|mathrm)\{[^}]+\}|\\[A-Za-z]+(?![A-Za-z])(?:\{[^}]*\})?)(?!\$)'
+)
+_DOUBLE_DOLLAR_RE = re.compile(r'\$\$([^$]+)\$\$')
+_EMPTY_MATH_RE = re.compile(r'\$\s*\$')
+
+# Wikipedia's "X {\\displaystyle X}" duplicates
+_DEDUP_EXACT_RE = re.compile(r'(\S+)\s+\{\\displaystyle\s+\1\s*\}')
+# Pattern: "X Y {\\displaystyle ...}". The whole run before the block is
+# matched; _dedup_displaystyle() keeps the match unchanged when the run is
+# longer than 20 characters, so scanning resumes after the block's }.
+# The lookbehind only lets a match start at the beginning of a run; a run
+# with no block after it then fails once instead of at every position in it
+_DEDUP_CHARS = r'A-Za-z0-9×÷±≤≥≠≈∈∉⊂⊃∪∩∞Σσαβγδλμπθφω\s\*\^'
+_DEDUP_RE = re.compile(
+    rf'(?<![{_DEDUP_CHARS}])([{_DEDUP_CHARS}]+)\s+\{{\\displaystyle\s+[^}}]*\}}'
+)
+
+# Unicode math symbol -> LaTeX, applied in a single str.translate pass
+_UNICODE_TO_LATEX_TABLE = str.maketrans({
+    '×': r' \times ',
+    '÷': r' \div ',
+    '±': r' \pm ',
+    '≤': r' \leq ',
+    '≥': r' \geq ',
+    '≠': r' \neq ',
+    '≈': r' \approx ',
+    '∈': r' \in ',
+    '∉': r' \notin ',
+    '⊂': r' \subset ',
+    '⊃': r' \supset ',
+    '∪': r' \cup ',
+    '∩': r' \cap ',
+    '∞': r'\infty',
+    '∑': r'\sum',
+    '∏': r'\prod',
+    '∫': r'\int',
+    '√': r'\sqrt',
+    '∂': r'\partial',
+    '∇': r'\nabla',
+})
+_UNICODE_MATH_CHARS = frozenset(chr(c) for c in _UNICODE_TO_LATEX_TABLE)
+
+# Invisible characters Wikipedia sprinkles around math: word joiner,
+# zero-width space and BOM. Deleted before the dedup patterns run, since
+# they break up the "X" those patterns look for in "X {\\displaystyle X}".
+_ZERO_WIDTH_TABLE = str.maketrans(dict.fromkeys('\u2060\u200b\ufeff'))
+
+# Plain-text LaTeX stripping
+_DISPLAYSTYLE_BLOCK_RE = re.compile(r'\{\\displaystyle[^}]*\}')
+_MATHBF_RE = re.compile(r'\\mathbf\s*\{([^}]*)\}')
+_MATHIT_RE = re.compile(r'\\mathit\s*\{([^}]*)\}')
+_MATHRM_RE = re.compile(r'\\mathrm\s*\{([^}]*)\}')
+_TEXT_RE = re.compile(r'\\text\s*\{([^}]*)\}')
+
+# LaTeX command -> Unicode symbol, matched in one pass (longest name first so
+# \infty wins over \in)
+_LATEX_CMD_MAP = {
+    r'\times': '×',
+    r'\cdot': '·',
+    r'\Sigma': 'Σ',
+    r'\sigma': 'σ',
+    r'\alpha': 'α',
+    r'\beta': 'β',
+    r'\gamma': 'γ',
+    r'\delta': 'δ',
+    r'\lambda': 'λ',
+    r'\mu': 'μ',
+    r'\pi': 'π',
+    r'\theta': 'θ',
+    r'\phi': 'φ',
+    r'\omega': 'ω',
+    r'\infty': '∞',
+    r'\leq': '≤',
+    r'\geq': '≥',
+    r'\neq': '≠',
+    r'\approx': '≈',
+    r'\in': '∈',
+    r'\subset': '⊂',
+    r'\supset': '⊃',
+    r'\pm': '±',
+}
+_LATEX_CMD_RE = re.compile('|'.join(re.escape(k) for k in sorted(_LATEX_CMD_MAP, key=len, reverse=True)))
+
+_SUP_STAR_RE = re.compile(r'\^\{?\*\}?')
+_SUP_GROUP_RE = re.compile(r'\^\{([^}]*)\}')
+_SUB_GROUP_RE = re.compile(r'_\{([^}]*)\}')
+
+# Leftover } and trailing commas, removed in one pass. The comma alternative
+# also swallows braces before the line end, matching the old order where
+# braces were removed before trailing commas were stripped.
+_BRACE_COMMA_RE = re.compile(r',[\s}]*$|\}', re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+
+def _flush_math_run(run: list, result: list) -> None:
+    """
+    Append a run of stacked math lines to result.
+    
+    Runs of 3+ tokens are collapsed into one space-separated line; shorter
+    runs are kept as the original lines.
+    """
+    if len(run) >= 3:
+        result.append(' '.join(line.strip() for line in run))
+    else:
+        result.extend(run)
+
+
 def collapse_stacked_math(text: str) -> str:
     """
     Collapse vertically stacked single characters/symbols into inline expressions.
@@ -69,36 +340,26 @@ def collapse_stacked_math(text: str) -> str:
     Returns:
         Text with collapsed math expressions.
     """
-    lines = text.split('\n')
     result = []
-    i = 0
+    run = []  # Consecutive short math-like lines (unstripped)
+    match_token = _MATH_TOKEN_RE.match
     
-    while i < len(lines):
-        line = lines[i].strip()
+    # Single pass: every line is stripped and matched exactly once
+    for raw_line in text.split('\n'):
+        line = raw_line.strip()
         
-        # Check if this looks like a stacked math sequence
-        # (short lines of 1-3 chars that are math-like)
-        if len(line) <= 3 and re.match(r'^[a-zA-Z0-9×÷±∓≤≥≠≈∈∉⊂⊃∪∩∧∨¬→←↔∀∃∂∇∫∑∏√∞αβγδεζηθικλμνξπρστυφχψωΓΔΘΛΞΠΣΦΨΩ=+\-*/^().,]+$', line):
-            # Collect consecutive short math-like lines
-            math_tokens = [line]
-            j = i + 1
-            while j < len(lines):
-                next_line = lines[j].strip()
-                if len(next_line) <= 3 and next_line and re.match(r'^[a-zA-Z0-9×÷±∓≤≥≠≈∈∉⊂⊃∪∩∧∨¬→←↔∀∃∂∇∫∑∏√∞αβγδεζηθικλμνξπρστυφχψωΓΔΘΛΞΠΣΦΨΩ=+\-*/^().,]+$', next_line):
-                    math_tokens.append(next_line)
-                    j += 1
-                else:
-                    break
-            
-            # If we found a sequence of 3+ math tokens, collapse them
-            if len(math_tokens) >= 3:
-                collapsed = ' '.join(math_tokens)
-                result.append(collapsed)
-                i = j
-                continue
+        # Short lines of 1-3 math-like chars extend the current run
+        if match_token(line):
+            run.append(raw_line)
+            continue
         
-        result.append(lines[i])
-        i += 1
+        if run:
+            _flush_math_run(run, result)
+            run = []
+        result.append(raw_line)
+    
+    if run:
+        _flush_math_run(run, result)
     
     return '\n'.join(result)
 
@@ -119,22 +380,23 @@ def convert_displaystyle_latex(text: str) -> str:
     Returns:
         Text with MathJax-compatible $...$ syntax.
     """
-    # Pattern for {\\displaystyle ...} blocks (handles nested braces)
-    def replace_displaystyle(match):
-        content = match.group(1)
-        # Clean up the content
-        content = content.strip()
+    # Split on {\\displaystyle ...} blocks (handles nested braces) instead of
+    # calling back into Python per match. split() repeats [text, group 1, ...,
+    # group N], so block bodies sit at a fixed stride in the result.
+    pieces = _DISPLAYSTYLE_RE.split(text)
+    stride = _DISPLAYSTYLE_RE.groups + 1
+    bodies = pieces[_DISPLAYSTYLE_RE.groupindex['body']::stride]
+    between = pieces[::stride]
+    
+    out = [between[0]]
+    for content, after in zip(bodies, between[1:]):
         # Ensure proper spacing around operators
-        content = re.sub(r'\\times', r' \\times ', content)
-        content = re.sub(r'\\cdot', r' \\cdot ', content)
-        content = re.sub(r'\s+', ' ', content)  # Normalize whitespace
-        return f'${content.strip()}$'
-    
-    # Match {\\displaystyle ...} with balanced braces
-    pattern = r'\{\\displaystyle\s+([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}'
-    text = re.sub(pattern, replace_displaystyle, text)
+        content = content.replace('\\times', ' \\times ').replace('\\cdot', ' \\cdot ')
+        # Normalize whitespace (also strips both ends)
+        out.append(f"${' '.join(content.split())}$")
+        out.append(after)
     
-    return text
+    return ''.join(out)
 
 
 def convert_inline_latex_fragments(text: str) -> str:
@@ -150,35 +412,30 @@ def convert_inline_latex_fragments(text: str) -> str:
     Returns:
         Text with LaTeX wrapped in $...$ for MathJax rendering.
     """
-    # Find LaTeX commands not already wrapped in $
-    # Pattern: backslash followed by command name (and possibly arguments)
-    def wrap_latex(match):
-        # Check if already inside $ delimiters
-        content = match.group(0)
-        return f'${content}$'
-    
-    # Match LaTeX commands that aren't already in $...$
-    # This is a simplified pattern that catches common cases
-    patterns = [
-        r'(?<!\$)\\mathbf\{[^}]+\}(?!\$)',
-        r'(?<!\$)\\mathit\{[^}]+\}(?!\$)',
-        r'(?<!\$)\\mathrm\{[^}]+\}(?!\$)',
-        r'(?<!\$)\\[A-Za-z]+(?:\{[^}]*\})?(?!\$)',
-    ]
-    
-    for pattern in patterns:
-        # Only wrap if not already between $ signs
-        text = re.sub(pattern, wrap_latex, text)
+    # Wrap LaTeX commands that aren't already in $...$ in a single pass
+    # (a simplified pattern that catches common cases)
+    text = _INLINE_LATEX_RE.sub(r'$\1$', text)
     
     # Clean up any double-wrapped math: $$...$$ -> $...$
-    text = re.sub(r'\$\$([^$]+)\$\$', r'$\1$', text)
+    text = _DOUBLE_DOLLAR_RE.sub(r'$\1$', text)
     
     # Clean up adjacent math blocks: $a$ $b$ -> $a \; b$
-    text = re.sub(r'\$\s*\$', ' ', text)
+    text = _EMPTY_MATH_RE.sub(' ', text)
     
     return text
 
 
+def _dedup_displaystyle(match) -> str:
+    """
+    Replacement for _DEDUP_RE: "X {\\displaystyle ...}" -> "{\\displaystyle X}"
+    for short X, anything longer is left as it was.
+    """
+    run = match.group(1).strip()
+    if len(run) > 20:
+        return match.group(0)
+    return '{\\displaystyle ' + run + '}'
+
+
 def clean_wikipedia_text(text: str, for_jupyter: bool = True) -> str:
     """
     Clean and format Wikipedia text for display.
@@ -193,96 +450,165 @@ def clean_wikipedia_text(text: str, for_jupyter: bool = True) -> str:
     # Step 1: Collapse stacked math tokens
     text = collapse_stacked_math(text)
     
-    # Step 2: Remove the ⁠ (word joiner) Unicode character that Wikipedia uses
-    text = text.replace('\u2060', '')
+    # Step 2: Remove the ⁠ (word joiner) and other zero-width characters that Wikipedia uses
+    text = text.translate(_ZERO_WIDTH_TABLE)
+    
+    # Pages without LaTeX markup (e.g. biographies) skip every LaTeX pass
+    # below; each {\\displaystyle ...} block contains a backslash too
+    has_latex = '\\' in text
     
     # Step 3: Remove duplicate math expressions (Wikipedia often has both Unicode and LaTeX)
-    # Pattern: "X {\\displaystyle X}" -> just keep the displaystyle version
-    text = re.sub(r'(\S+)\s+\{\\displaystyle\s+\1\s*\}', r'{\\displaystyle \1}', text)
-    # Pattern: "X Y {\\displaystyle X Y}" or similar
-    text = re.sub(r'([A-Za-z0-9×÷±≤≥≠≈∈∉⊂⊃∪∩∞Σσαβγδλμπθφω\s\*\^]+)\s+\{\\displaystyle\s+[^}]*\}', 
-                  lambda m: '{\\displaystyle ' + m.group(1).strip() + '}' if len(m.group(1).strip()) <= 20 else m.group(0), 
-                  text)
+    if has_latex:
+        # Pattern: "X {\\displaystyle X}" -> just keep the displaystyle version
+        text = _DEDUP_EXACT_RE.sub(r'{\\displaystyle \1}', text)
+        # Pattern: "X Y {\\displaystyle X Y}" or similar
+        text = _DEDUP_RE.sub(_dedup_displaystyle, text)
     
     if for_jupyter:
         # Step 4: Convert displaystyle LaTeX
-        text = convert_displaystyle_latex(text)
+        if has_latex:
+            text = convert_displaystyle_latex(text)
         
-        # Step 5: Convert remaining LaTeX fragments
-        text = convert_inline_latex_fragments(text)
+        # Step 5: Convert remaining LaTeX fragments (also tidies stray $...$)
+        if has_latex or '$' in text:
+            text = convert_inline_latex_fragments(text)
         
         # Step 6: Clean up common Unicode math symbols for consistency
-        unicode_to_latex = {
-            '×': r' \times ',
-            '÷': r' \div ',
-            '±': r' \pm ',
-            '≤': r' \leq ',
-            '≥': r' \geq ',
-            '≠': r' \neq ',
-            '≈': r' \approx ',
-            '∈': r' \in ',
-            '∉': r' \notin ',
-            '⊂': r' \subset ',
-            '⊃': r' \supset ',
-            '∪': r' \cup ',
-            '∩': r' \cap ',
-            '∞': r'\infty',
-            '∑': r'\sum',
-            '∏': r'\prod',
-            '∫': r'\int',
-            '√': r'\sqrt',
-            '∂': r'\partial',
-            '∇': r'\nabla',
-        }
-        # Only convert if inside $ delimiters or if isolated
-        for unicode_char, latex in unicode_to_latex.items():
-            text = text.replace(unicode_char, latex)
+        if not _UNICODE_MATH_CHARS.isdisjoint(text):
+            text = text.translate(_UNICODE_TO_LATEX_TABLE)
     else:
         # Plain text mode: remove displaystyle wrapper and clean LaTeX
-        # First, remove the entire {\\displaystyle ...} blocks (they're duplicates of nearby Unicode)
-        text = re.sub(r'\{\\displaystyle[^}]*\}', '', text)
-        text = re.sub(r'\\mathbf\s*\{([^}]*)\}', r'\1', text)  # \mathbf{M} -> M
-        text = re.sub(r'\\mathit\s*\{([^}]*)\}', r'\1', text)  # \mathit{x} -> x
-        text = re.sub(r'\\mathrm\s*\{([^}]*)\}', r'\1', text)  # \mathrm{T} -> T
-        text = re.sub(r'\\text\s*\{([^}]*)\}', r'\1', text)    # \text{...} -> ...
-        text = re.sub(r'\\times', '×', text)
-        text = re.sub(r'\\cdot', '·', text)
-        text = re.sub(r'\\Sigma', 'Σ', text)
-        text = re.sub(r'\\sigma', 'σ', text)
-        text = re.sub(r'\\alpha', 'α', text)
-        text = re.sub(r'\\beta', 'β', text)
-        text = re.sub(r'\\gamma', 'γ', text)
-        text = re.sub(r'\\delta', 'δ', text)
-        text = re.sub(r'\\lambda', 'λ', text)
-        text = re.sub(r'\\mu', 'μ', text)
-        text = re.sub(r'\\pi', 'π', text)
-        text = re.sub(r'\\theta', 'θ', text)
-        text = re.sub(r'\\phi', 'φ', text)
-        text = re.sub(r'\\omega', 'ω', text)
-        text = re.sub(r'\\infty', '∞', text)
-        text = re.sub(r'\\leq', '≤', text)
-        text = re.sub(r'\\geq', '≥', text)
-        text = re.sub(r'\\neq', '≠', text)
-        text = re.sub(r'\\approx', '≈', text)
-        text = re.sub(r'\\in', '∈', text)
-        text = re.sub(r'\\subset', '⊂', text)
-        text = re.sub(r'\\supset', '⊃', text)
-        text = re.sub(r'\\pm', '±', text)
-        text = re.sub(r'\^\{?\*\}?', '*', text)  # ^{*} or ^* -> *
-        text = re.sub(r'\^\{([^}]*)\}', r'^\1', text)  # ^{2} -> ^2
-        text = re.sub(r'_\{([^}]*)\}', r'_\1', text)  # _{ij} -> _ij
-        text = re.sub(r'\}', '', text)  # Remove remaining }
-        text = re.sub(r',\s*$', '', text, flags=re.MULTILINE)  # Trailing commas
-        # Clean up multiple spaces
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        if has_latex:
+            # First, remove the entire {\\displaystyle ...} blocks (they're duplicates of nearby Unicode)
+            text = _DISPLAYSTYLE_BLOCK_RE.sub('', text)
+            text = _MATHBF_RE.sub(r'\1', text)  # \mathbf{M} -> M
+            text = _MATHIT_RE.sub(r'\1', text)  # \mathit{x} -> x
+            text = _MATHRM_RE.sub(r'\1', text)  # \mathrm{T} -> T
+            text = _TEXT_RE.sub(r'\1', text)    # \text{...} -> ...
+            text = _LATEX_CMD_RE.sub(lambda m: _LATEX_CMD_MAP[m.group(0)], text)  # \times -> ×, ...
+        text = _SUP_STAR_RE.sub('*', text)  # ^{*} or ^* -> *
+        text = _SUP_GROUP_RE.sub(r'^\1', text)  # ^{2} -> ^2
+        text = _SUB_GROUP_RE.sub(r'_\1', text)  # _{ij} -> _ij
+        text = _BRACE_COMMA_RE.sub('', text)  # Remaining } and trailing commas
+        # Clean up multiple spaces (newlines included)
+        text = ' '.join(text.split())
     
     # Remove excessive blank lines
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _BLANK_LINES_RE.sub('\n\n', text)
     
     return text.strip()
 
 
+# =============================================================================
+# Caching
+# =============================================================================
+
+# Persistent page cache; entries older than _CACHE_MAX_AGE are refetched
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'wiki_math')
+_CACHE_FILE = os.path.join(_CACHE_DIR, 'pages')
+_CACHE_MAX_AGE = 30 * 24 * 60 * 60  # 30 days, in seconds
+_CACHE_LOCK = threading.Lock()
+
+
+def _disk_cache_get(key: str):
+    """
+    Look up a fresh entry in the on-disk page cache.
+    
+    Args:
+        key: Cache key built from the query and sentence count.
+        
+    Returns:
+        tuple: (title, content), or None if missing or older than 30 days.
+    """
+    try:
+        with _CACHE_LOCK, shelve.open(_CACHE_FILE, flag='r') as db:
+            entry = db.get(key)
+    except Exception:
+        # The disk cache is best-effort: a missing/unreadable file is a miss
+        return None
+    
+    if entry is None:
+        return None
+    title, content, fetched_at = entry
+    if time.time() - fetched_at > _CACHE_MAX_AGE:
+        return None
+    return title, content
+
+
+def _disk_cache_put(key: str, title: str, content: str) -> None:
+    """
+    Store a page in the on-disk cache, stamped with the current time.
+    
+    Args:
+        key: Cache key built from the query and sentence count.
+        title: Resolved Wikipedia page title.
+        content: Raw (unformatted) page text.
+    """
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with _CACHE_LOCK, shelve.open(_CACHE_FILE) as db:
+            db[key] = (title, content, time.time())
+    except Exception:
+        # Read-only home directory etc. -- just skip persisting
+        pass
+
+
+@functools.lru_cache(maxsize=256)
+def _wiki_fetch_cached(query: str, sentences: int = 0, full: bool = False):
+    """
+    Fetch the raw title and content for a query, with caching.
+    
+    Results are memoized in-process and persisted on disk, so warm queries
+    never touch the network. Errors are raised, and therefore not cached.
+    
+    Args:
+        query: Search query or exact page title.
+        sentences: Number of sentences to return (0 = full summary).
+        full: If True, return the full page content; `sentences` is ignored.
+        
+    Returns:
+        tuple: (title, content) with unformatted content, or None if the
+        search found no pages.
+    """
+    key = f"full:{query}" if full else f"summary:{sentences}:{query}"
+    cached = _disk_cache_get(key)
+    if cached is not None:
+        return cached
+    
+    wikipedia = _wikipedia()
+    
+    # Search for the page
+    results = _with_retry(wikipedia.search, query)
+    if not results:
+        return None
+    
+    # Get the page content
+    try:
+        page = _with_retry(wikipedia.page, results[0], auto_suggest=False)
+    except wikipedia.DisambiguationError as e:
+        # If disambiguation, try the first option
+        page = _with_retry(wikipedia.page, e.options[0], auto_suggest=False)
+    
+    # Get summary or full content
+    if full:
+        content = page.content
+    elif sentences > 0:
+        content = _with_retry(wikipedia.summary, page.title, sentences=sentences)
+    else:
+        content = page.summary
+    
+    _disk_cache_put(key, page.title, content)
+    return page.title, content
+
+
+@functools.lru_cache(maxsize=256)
+def _format_content(content: str, for_jupyter: bool) -> str:
+    """
+    Memoized clean_wikipedia_text, keyed on the content and output mode.
+    """
+    return clean_wikipedia_text(content, for_jupyter=for_jupyter)
+
+
 # =============================================================================
 # Main Functions
 # =============================================================================
@@ -299,39 +625,28 @@ def wiki_fetch(query: str, sentences: int = 0) -> str:
         Formatted text content suitable for current environment.
     """
     try:
-        # Search for the page
-        results = wikipedia.search(query)
-        if not results:
+        fetched = _wiki_fetch_cached(query, sentences)
+        if fetched is None:
             return f"No Wikipedia results found for: {query}"
-        
-        # Get the page content
-        try:
-            page = wikipedia.page(results[0], auto_suggest=False)
-        except wikipedia.DisambiguationError as e:
-            # If disambiguation, try the first option
-            page = wikipedia.page(e.options[0], auto_suggest=False)
-        
-        # Get summary or full content
-        if sentences > 0:
-            content = wikipedia.summary(page.title, sentences=sentences)
-        else:
-            content = page.summary
+        title, content = fetched
         
         # Format the content
         for_jupyter = is_jupyter()
-        formatted = clean_wikipedia_text(content, for_jupyter=for_jupyter)
+        formatted = _format_content(content, for_jupyter)
         
         # Add title header
         if for_jupyter:
-            header = f"## {page.title}\n\n"
+            header = f"## {title}\n\n"
         else:
-            header = f"=== {page.title} ===\n\n"
+            header = f"=== {title} ===\n\n"
         
         return header + formatted
     
-    except wikipedia.PageError:
-        return f"Wikipedia page not found for: {query}"
     except Exception as e:
+        # A PageError can only come from an actual fetch, by which point
+        # _wikipedia() has imported the package (cache hits never import it)
+        if _WIKIPEDIA is not None and isinstance(e, _WIKIPEDIA.PageError):
+            return f"Wikipedia page not found for: {query}"
         return f"Error fetching Wikipedia content: {str(e)}"
 
 
@@ -367,6 +682,32 @@ def wiki_math(query: str, sentences: int = 0):
         return None
 
 
+def wiki_math_batch(queries: list, sentences: int = 0, max_workers: int = 8):
+    """
+    Fetch and display several Wikipedia pages, downloading them concurrently.
+    
+    All pages are fetched in parallel over the shared keep-alive session,
+    then displayed one after another in the order of `queries`.
+    
+    Args:
+        queries: Search queries or exact page titles.
+        sentences: Number of sentences to return (0 = full summary).
+        max_workers: Number of concurrent fetches. Keep this at or below
+            _POOL_MAXSIZE so every worker gets a pooled connection.
+    
+    Example:
+        >>> wiki_math_batch(["Matrix multiplication", "Dot product"], sentences=3)
+        # Displays both pages, fetched in about one round-trip of wall time
+    """
+    # Warm the page cache concurrently. Failed fetches aren't cached, so
+    # their errors are reported by wiki_math below.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        wait([executor.submit(_wiki_fetch_cached, query, sentences) for query in queries])
+    
+    for query in queries:
+        wiki_math(query, sentences=sentences)
+
+
 def wiki_content(query: str) -> str:
     """
     Fetch the full Wikipedia page content (not just summary).
@@ -378,22 +719,18 @@ def wiki_content(query: str) -> str:
         Full formatted page content.
     """
     try:
-        results = wikipedia.search(query)
-        if not results:
+        fetched = _wiki_fetch_cached(query, full=True)
+        if fetched is None:
             return f"No Wikipedia results found for: {query}"
-        
-        try:
-            page = wikipedia.page(results[0], auto_suggest=False)
-        except wikipedia.DisambiguationError as e:
-            page = wikipedia.page(e.options[0], auto_suggest=False)
+        title, content = fetched
         
         for_jupyter = is_jupyter()
-        formatted = clean_wikipedia_text(page.content, for_jupyter=for_jupyter)
+        formatted = _format_content(content, for_jupyter)
         
         if for_jupyter:
-            header = f"# {page.title}\n\n"
+            header = f"# {title}\n\n"
         else:
-            header = f"{'='*60}\n{page.title}\n{'='*60}\n\n"
+            header = f"{'='*60}\n{title}\n{'='*60}\n\n"
         
         return header + formatted
     